@@ -194,6 +194,8 @@ export function openCraftingUI(textures) {
     if (status) status.innerText = '';
     list.innerHTML = '';
 
+    // Build rows off-document and attach them in a single insertion
+    const fragment = document.createDocumentFragment();
     CRAFTING_RECIPES.forEach(recipe => {
         const div = document.createElement('div');
         div.className = 'craft-item';
@@ -238,8 +240,9 @@ export function openCraftingUI(textures) {
 
         div.appendChild(inputsDiv);
         div.appendChild(outputsDiv);
-        list.appendChild(div);
+        fragment.appendChild(div);
     });
+    list.appendChild(fragment);
 
     modal.style.display = 'block';
 